@@ -27,9 +27,8 @@ from notify_api.config import config
 from notify_api.exceptions import ExceptionHandler
 from notify_api.metadata import APP_RUNNING_ENVIRONMENT
 from notify_api.models import db
-from notify_api.resources import meta_endpoint, ops_endpoint, v1_endpoint, v2_endpoint
-from notify_api.services.gcp_queue import queue
 from notify_api.utils.auth import jwt
+from notify_api.utils.json_provider import OrjsonProvider
 
 logger = StructuredLogging.get_logger()
 
@@ -38,9 +37,11 @@ def create_app(run_mode: str = APP_RUNNING_ENVIRONMENT) -> Flask:
     """Return a configured Flask App using the Factory method."""
     app = Flask(__name__)
     app.config.from_object(config[run_mode])
+    app.json = OrjsonProvider(app)
     app.url_map.strict_slashes = False
 
-    CORS(app, resources="*")
+    if run_mode != "migration":
+        CORS(app, resources="*")
 
     schema = app.config.get("DB_SCHEMA", "public")
 
@@ -64,6 +65,19 @@ def create_app(run_mode: str = APP_RUNNING_ENVIRONMENT) -> Flask:
 
         # Use the cloud-sql-connector's built-in engine options
         app.config["SQLALCHEMY_ENGINE_OPTIONS"] = db_config.get_engine_options()
+    else:
+        # Direct connections get the same pool settings, so bursts reuse connections and stale ones are
+        # replaced after a database restart instead of failing the request.
+        app.config.setdefault(
+            "SQLALCHEMY_ENGINE_OPTIONS",
+            {
+                "pool_size": 10,
+                "max_overflow": 10,
+                "pool_timeout": 30,
+                "pool_recycle": 3600,  # 1 hour
+                "pool_pre_ping": True,
+            },
+        )
 
     db.init_app(app)
 
@@ -85,6 +99,10 @@ def create_app(run_mode: str = APP_RUNNING_ENVIRONMENT) -> Flask:
             upgrade(directory="migrations", revision="head", sql=False, tag=None)
         logger.info("Finished migration upgrade.")
     else:
+        # Imported here so migration jobs do not load the API resources or the queue client.
+        from notify_api.resources import meta_endpoint, ops_endpoint, v1_endpoint, v2_endpoint
+        from notify_api.services.gcp_queue import queue
+
         queue.init_app(app)
         meta_endpoint.init_app(app)
         ops_endpoint.init_app(app)
@@ -31,7 +31,11 @@ bp = Blueprint("Notify", __name__, url_prefix="/notify")
 @jwt.has_one_of_roles([Role.SYSTEM.value, Role.PUBLIC_USER.value, Role.STAFF.value])
 @validate()
 def send_notification(body: NotificationRequest):
-    """Create and send EMAIL notification endpoint."""
+    """Create and send EMAIL notification endpoint.
+
+    Delivery is asynchronous: the notification is persisted and published to Pub/Sub, and
+    notify-delivery calls the provider (e.g. GC Notify), so no provider round trip happens here.
+    """
     body.notify_type = Notification.NotificationType.EMAIL
     notification = notify.queue_publish(body)
     # Eagerly build response dict to avoid ObjectDeletedError /
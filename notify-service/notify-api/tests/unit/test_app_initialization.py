@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 from flask import Flask
 
 from notify_api import create_app
+from notify_api.utils.json_provider import OrjsonProvider
 
 
 class TestAppInitialization(unittest.TestCase):
@@ -11,7 +12,7 @@ class TestAppInitialization(unittest.TestCase):
 
     @patch("notify_api.setup_pg8000_close_event_listener")
     @patch("notify_api.setup_search_path_event_listener")
-    @patch("notify_api.queue")
+    @patch("notify_api.services.gcp_queue.queue")
     @patch("notify_api.db")
     @patch("notify_api.config")
     def test_create_app_basic(
@@ -38,16 +39,19 @@ class TestAppInitialization(unittest.TestCase):
             patch("notify_api.setup_jwt_manager"),
             patch("notify_api.register_shellcontext"),
             patch("notify_api.ExceptionHandler"),
-            patch("notify_api.meta_endpoint"),
-            patch("notify_api.ops_endpoint"),
-            patch("notify_api.v1_endpoint"),
-            patch("notify_api.v2_endpoint"),
+            patch("notify_api.resources.meta_endpoint"),
+            patch("notify_api.resources.ops_endpoint"),
+            patch("notify_api.resources.v1_endpoint"),
+            patch("notify_api.resources.v2_endpoint"),
         ):
             app = create_app("unitTesting")
 
         # Assert
         assert isinstance(app, Flask)
         assert app.config is not None
+        assert isinstance(app.json, OrjsonProvider)
         mock_db.init_app.assert_called_once_with(app)
         mock_queue.init_app.assert_called_once_with(app)
         mock_setup_pg8000_listener.assert_called_once_with(mock_engine)
+        engine_options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+        assert engine_options["pool_pre_ping"] is True
@@ -0,0 +1,50 @@
+"""Tests for the orjson JSON provider."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+import json
+import uuid
+
+from flask import Flask, jsonify
+
+from notify_api.utils.json_provider import OrjsonProvider
+
+
+def _app() -> Flask:
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_dumps_matches_default_provider():
+    """Output should decode to the same document Flask's default provider produced."""
+    app = _app()
+    default_app = Flask(__name__)
+    data = {
+        "b": 1,
+        "a": [Decimal("1.50"), uuid.UUID(int=1)],
+        "sent": datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+    }
+
+    assert json.loads(app.json.dumps(data)) == json.loads(default_app.json.dumps(data))
+    assert list(json.loads(app.json.dumps(data))) == ["a", "b", "sent"]
+    assert app.json.dumps({1: "x"}) == '{"1":"x"}'
+
+
+def test_loads_accepts_str_and_bytes():
+    """Request bodies may arrive as str or bytes."""
+    app = _app()
+
+    assert app.json.loads('{"a": 1}') == {"a": 1}
+    assert app.json.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_jsonify_response():
+    """Jsonify should build the response body through orjson."""
+    app = _app()
+
+    with app.app_context():
+        response = jsonify(notifications=[{"id": 1}])
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"notifications": [{"id": 1}]}
@@ -13,8 +13,10 @@
 # limitations under the License.
 """This provides send email through GC Notify Service."""
 
-import base64
+import binascii
+import contextvars
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from flask import current_app
 from notifications_python_client import NotificationsAPIClient
@@ -37,6 +39,8 @@ class GCNotify:
     MAX_RETRIES = 3
     RETRY_BASE_DELAY = 10  # seconds
     RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+    # Upper bound on concurrent per-recipient sends
+    MAX_SEND_WORKERS = 10
 
     def __init__(self, notification: Notification) -> None:
         """Construct object."""
@@ -63,10 +67,11 @@ class GCNotify:
             "email_body": content.body,
         }
 
+        # Encoded once per notification; the client only reads this dict, so every recipient shares it.
         if content.attachments:
             for idx, attachment in enumerate(content.attachments):
                 personalisation[f"attachment{idx + 1}"] = {
-                    "file": base64.b64encode(attachment.file_bytes).decode(),
+                    "file": binascii.b2a_base64(attachment.file_bytes, newline=False).decode("ascii"),
                     "filename": attachment.file_name,
                     "sending_method": "attach",
                 }
@@ -86,17 +91,30 @@ class GCNotify:
         personalisation = self._prepare_personalisation(content)
 
         response_list: list[NotificationSendResponse] = []
-        recipients = [r.strip() for r in self.notification.recipients.split(",") if r.strip()]
+        # Trimmed, without blanks and de-duplicated (first occurrence wins) so no one gets the email twice.
+        recipients = list(dict.fromkeys(r.strip() for r in self.notification.recipients.split(",") if r.strip()))
+        if not recipients:
+            return NotificationSendResponses(recipients=[])
 
-        for recipient in recipients:
-            try:
-                response = self._send_with_retry(recipient, personalisation)
-                if response:
-                    response_list.append(NotificationSendResponse(response_id=response["id"], recipient=recipient))
-            except HTTPError as e:
-                logger.error(f"Error sending email to {recipient}: {e}")
-            except Exception as e:
-                logger.error(f"An unexpected error occurred when sending email to {recipient}: {e}")
+        # Each recipient is an independent HTTPS call to GC Notify, so send them concurrently.
+        # The bulk endpoint (/v2/notifications/bulk) is not used: it returns a single job id, while the
+        # history records and the status callbacks are matched on each recipient's notification id.
+        # Each worker runs in a copy of the caller's context, so it sees the same app context and log context.
+        with ThreadPoolExecutor(max_workers=min(len(recipients), self.MAX_SEND_WORKERS)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._send_with_retry, recipient, personalisation)
+                for recipient in recipients
+            ]
+
+            for recipient, future in zip(recipients, futures):
+                try:
+                    response = future.result()
+                    if response:
+                        response_list.append(NotificationSendResponse(response_id=response["id"], recipient=recipient))
+                except HTTPError as e:
+                    logger.error(f"Error sending email to {recipient}: {e}")
+                except Exception as e:
+                    logger.error(f"An unexpected error occurred when sending email to {recipient}: {e}")
 
         return NotificationSendResponses(recipients=response_list)
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Test suite for GC Notify service provider."""
 
+import base64
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
@@ -215,3 +216,69 @@ class TestGCNotify(unittest.TestCase):
         self.assertEqual(responses.recipients[0].response_id, "success-after-503")
         self.assertEqual(mock_client.send_email_notification.call_count, 2)
         mock_sleep.assert_called_once_with(10)
+
+    @patch("notify_delivery.services.providers.gc_notify.NotificationsAPIClient")
+    def test_send_multiple_recipients_keeps_order(self, mock_notifications_client):
+        """Test concurrent sends report responses in recipient order and skip failed recipients."""
+
+        def send_email_notification(email_address, **kwargs):
+            if email_address == "bad@example.com":
+                raise Exception("Test error")
+            return {"id": f"id-{email_address}"}
+
+        mock_notifications_client.return_value.send_email_notification.side_effect = send_email_notification
+        content = MagicMock(spec=NotificationContent)
+        content.subject = "Test Subject"
+        content.body = "Test Body"
+        content.attachments = None
+        notification = MagicMock(spec=Notification)
+        notification.recipients = "a@example.com, bad@example.com, c@example.com"
+        notification.content = [content]
+
+        gc_notify = GCNotify(notification)
+        responses = gc_notify.send()
+
+        self.assertEqual([r.recipient for r in responses.recipients], ["a@example.com", "c@example.com"])
+        self.assertEqual(responses.recipients[1].response_id, "id-c@example.com")
+
+    @patch("notify_delivery.services.providers.gc_notify.NotificationsAPIClient")
+    def test_send_deduplicates_recipients(self, mock_notifications_client):
+        """Test blank and repeated recipients are dropped before sending."""
+        mock_notifications_client.return_value.send_email_notification.return_value = {"id": "test-id"}
+        content = MagicMock(spec=NotificationContent)
+        content.subject = "Test Subject"
+        content.body = "Test Body"
+        content.attachments = None
+        notification = MagicMock(spec=Notification)
+        notification.recipients = "a@example.com, ,b@example.com,a@example.com ,"
+        notification.content = [content]
+
+        gc_notify = GCNotify(notification)
+        responses = gc_notify.send()
+
+        self.assertEqual([r.recipient for r in responses.recipients], ["a@example.com", "b@example.com"])
+        self.assertEqual(mock_notifications_client.return_value.send_email_notification.call_count, 2)
+
+    @patch("notify_delivery.services.providers.gc_notify.NotificationsAPIClient")
+    def test_send_attachment_encoded_once_for_all_recipients(self, mock_notifications_client):
+        """Test attachments are base64 encoded once and the same personalisation is shared by every recipient."""
+        attachment = MagicMock()
+        attachment.file_bytes = b"test file content"
+        attachment.file_name = "test.pdf"
+        content = MagicMock(spec=NotificationContent)
+        content.subject = "Test Subject"
+        content.body = "Test Body"
+        content.attachments = [attachment]
+        notification = MagicMock(spec=Notification)
+        notification.recipients = "test1@example.com, test2@example.com"
+        notification.content = [content]
+
+        gc_notify = GCNotify(notification)
+        gc_notify.send()
+
+        calls = mock_notifications_client.return_value.send_email_notification.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertIs(calls[0].kwargs["personalisation"], calls[1].kwargs["personalisation"])
+        self.assertEqual(
+            calls[0].kwargs["personalisation"]["attachment1"]["file"], base64.b64encode(b"test file content").decode()
+        )
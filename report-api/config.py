@@ -64,6 +64,10 @@ class _Config():  # pylint: disable=too-few-public-methods
     JWT_OIDC_JWKS_CACHE_TIMEOUT = int(os.getenv('JWT_OIDC_JWKS_CACHE_TIMEOUT', '300'))
 
     GOTENBERG_URL = os.getenv('GOTENBERG_URL', 'http://localhost:3000')
+    FOOTER_PDF_CONCURRENCY = int(os.getenv('FOOTER_PDF_CONCURRENCY', '8'))
+    # Let Chromium draw the footer in the same Gotenberg call instead of overlaying it afterwards.
+    GOTENBERG_NATIVE_FOOTER = os.getenv('GOTENBERG_NATIVE_FOOTER', 'false').lower() == 'true'
+    GOTENBERG_FOOTER_MARGIN = os.getenv('GOTENBERG_FOOTER_MARGIN', '1.25')
 
     TESTING = False
     DEBUG = True
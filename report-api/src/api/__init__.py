@@ -15,7 +15,7 @@
 
 import os
 
-from flask import Flask
+from flask import Flask, url_for
 from sbc_common_components.exception_handling.exception_handler import ExceptionHandler  # noqa: I001
 
 import config  # pylint:disable=import-error
@@ -39,6 +39,7 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
     app.register_blueprint(OPS_BLUEPRINT)
 
     setup_jwt_manager(app, jwt)
+    register_static_urls(app)
 
     ExceptionHandler(app)
 
@@ -64,6 +65,13 @@ def setup_jwt_manager(app, jwt_manager):
     jwt_manager.init_app(app)
 
 
+def register_static_urls(app):
+    """Resolve the logo URLs passed to the report templates once, instead of routing them on every report."""
+    with app.test_request_context():
+        app.config['BC_LOGO_URL'] = url_for('static', filename='images/bcgov-logo-vert.jpg')
+        app.config['REGISTRIES_LOGO_URL'] = url_for('static', filename='images/reg_logo.png')
+
+
 def register_shellcontext(app):
     """Register shell context objects."""
 
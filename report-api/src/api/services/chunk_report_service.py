@@ -22,21 +22,17 @@ import time
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from flask import current_app, url_for
-from jinja2 import Environment, FileSystemLoader
+from flask import current_app
 
-from api.services.footer_service import add_page_numbers_to_pdf
+from api.services.footer_service import PDF_SAVE_OPTIONS, add_page_numbers_to_pdf
 from api.services.gotenberg_service import GotenbergService
+from api.services.template_env import ENV
 from api.utils.util import TEMPLATE_FOLDER_PATH, sanitize_template_name
 
 
 class ChunkReportService:  # pylint:disable=too-few-public-methods
     """Service for generating large reports using chunk approach."""
 
-    _TEMPLATE_ENV = Environment(
-        loader=FileSystemLoader('.'), autoescape=True
-    )
-
     @dataclass
     class ChunkInfo:
         """Chunk info for chunk report."""
@@ -58,6 +54,12 @@ class ChunkReportService:  # pylint:disable=too-few-public-methods
     @staticmethod
     def _merge_pdf_files(temp_files: List[str]) -> bytes:
         """Merge multiple PDF files into one."""
+        merged_pdf, _ = ChunkReportService._merge_pdf_files_with_page_count(temp_files)
+        return merged_pdf
+
+    @staticmethod
+    def _merge_pdf_files_with_page_count(temp_files: List[str]) -> Tuple[bytes, int]:
+        """Merge multiple PDF files into one, returning the merged bytes and its page count."""
         # Lazy import to avoid heavy module import in worker processes
         from pikepdf import Pdf  # pylint:disable=import-outside-toplevel
 
@@ -66,8 +68,8 @@ class ChunkReportService:  # pylint:disable=too-few-public-methods
                 with Pdf.open(path) as src:
                     out_pdf.pages.extend(src.pages)
             buf = io.BytesIO()
-            out_pdf.save(buf)
-            return buf.getvalue()
+            out_pdf.save(buf, **PDF_SAVE_OPTIONS)
+            return buf.getvalue(), len(out_pdf.pages)
 
     @staticmethod
     def _append_pdf_bytes(pdf_content: bytes, temp_files: List[str]) -> None:
@@ -87,11 +89,11 @@ class ChunkReportService:  # pylint:disable=too-few-public-methods
         chunk_vars['_chunk_info'] = asdict(chunk_info)
 
         sanitized_name = sanitize_template_name(template_name)
-        template = ChunkReportService._TEMPLATE_ENV.get_template(
+        template = ENV.get_template(
             f'{TEMPLATE_FOLDER_PATH}/{sanitized_name}.html'
         )
-        bc_logo_url = url_for('static', filename='images/bcgov-logo-vert.jpg')
-        registries_url = url_for('static', filename='images/reg_logo.png')
+        bc_logo_url = current_app.config['BC_LOGO_URL']
+        registries_url = current_app.config['REGISTRIES_LOGO_URL']
         return template.render(
             chunk_vars, bclogoUrl=bc_logo_url, registriesurl=registries_url
         )
@@ -162,11 +164,14 @@ class ChunkReportService:  # pylint:disable=too-few-public-methods
         for pdf_content in pdf_chunks:
             ChunkReportService._append_pdf_bytes(pdf_content, temp_files)
 
-        merged_pdf_without_footers = ChunkReportService._merge_pdf_files(temp_files)
+        merged_pdf_without_footers, total_pages = ChunkReportService._merge_pdf_files_with_page_count(temp_files)
 
         ChunkReportService._cleanup_temp_files(temp_files)
 
-        result = add_page_numbers_to_pdf(template_vars, merged_pdf_without_footers, generate_page_number)
+        # The merge already knows the page count, so the footer pass does not re-parse the merged PDF for it.
+        result = add_page_numbers_to_pdf(
+            template_vars, merged_pdf_without_footers, generate_page_number, total_pages=total_pages
+        )
 
         current_app.logger.info(
             'chunk_report done: chunks=%s elapsed=%.1fs', len(tasks), time.time() - overall_start_time
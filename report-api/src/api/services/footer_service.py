@@ -14,26 +14,117 @@
 """Shared helpers for rendering footer in PDF documents."""
 
 import asyncio
+import contextlib
 import io
+import math
+import mmap
+import re
 from io import BytesIO
-from typing import Any, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import pikepdf
 from flask import current_app
-from jinja2 import Environment, FileSystemLoader
 
 from api.services.gotenberg_service import GotenbergService
+from api.services.template_env import ENV
 from api.utils.util import TEMPLATE_FOLDER_PATH
 
-_TEMPLATE_ENV = Environment(
-    loader=FileSystemLoader('.'), autoescape=True
-)
+# Rendered PDFs larger than this spill from memory to a temp file while the footer is applied.
+PDF_SPOOL_MAX_SIZE = 10 * 1024 * 1024
+
+# Footer batches are only split across workers once each batch would still hold this many pages.
+FOOTER_MIN_BATCH_PAGES = 50
+
+# The inputs come from Gotenberg already flate-compressed, so write streams through untouched instead of
+# letting qpdf decode and re-deflate them; only streams we generate (overlay operators) get compressed.
+PDF_SAVE_OPTIONS = {
+    'compress_streams': True,
+    'stream_decode_level': pikepdf.StreamDecodeLevel.none,
+    'recompress_flate': False,
+    'object_stream_mode': pikepdf.ObjectStreamMode.preserve,
+    'linearize': False,
+}
+
+
+def _open_pdf_source(pdf_source: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Return a readable stream for PDF bytes or a (spooled) file, rewound to the start."""
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return BytesIO(pdf_source)
+    pdf_source.seek(0)
+    return pdf_source
+
+
+def _read_pdf_source(pdf_source: Union[bytes, BinaryIO]) -> bytes:
+    """Return the PDF as bytes."""
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return bytes(pdf_source)
+    pdf_source.seek(0)
+    return pdf_source.read()
+
+
+_PDF_ROOT_REF = re.compile(rb'/Root\s+(\d+)\s+(\d+)\s+R')
+_PDF_PAGES_REF = re.compile(rb'/Pages\s+(\d+)\s+(\d+)\s+R')
+# An indirect count ('/Count 9 0 R') is not followed; the scan gives up and pikepdf resolves it.
+_PDF_PAGE_COUNT = re.compile(rb'/Count\s+(\d+)(?!\d)(?!\s+\d+\s+R)')
+_PDF_PAGES_TYPE = re.compile(rb'/Type\s*/Pages\b')
+
+
+def _find_pdf_object(pdf_bytes: Union[bytes, mmap.mmap], obj_num: bytes, gen_num: bytes) -> Optional[bytes]:
+    """Return the body of the last (most recent) top-level definition of an object, or None."""
+    # Writers put 'N G obj' on its own line; a plain rfind is much cheaper than a regex over the whole file.
+    header = obj_num + b' ' + gen_num + b' obj'
+    start = max(pdf_bytes.rfind(b'\n' + header), pdf_bytes.rfind(b'\r' + header))
+    if start != -1:
+        start += len(header) + 1
+    else:
+        matches = list(re.finditer(rb'(?<!\d)' + obj_num + rb'\s+' + gen_num + rb'\s+obj\b', pdf_bytes))
+        if not matches:
+            return None
+        start = matches[-1].end()
+    end = pdf_bytes.find(b'endobj', start)
+    return pdf_bytes[start:end if end != -1 else None]
+
+
+def _scan_pdf_page_count(pdf_bytes: Union[bytes, mmap.mmap]) -> Optional[int]:
+    """Read trailer /Root -> catalog /Pages -> /Count from the raw bytes, without parsing the whole document.
+
+    Returns None when the objects are not stored as plain text (e.g. inside compressed object streams).
+    """
+    # The trailer (or cross-reference stream dictionary) is the last thing written, so its /Root is the last one.
+    root_ref = _PDF_ROOT_REF.match(pdf_bytes, max(pdf_bytes.rfind(b'/Root'), 0))
+    catalog = root_ref and _find_pdf_object(pdf_bytes, *root_ref.groups())
+    pages_ref = catalog and _PDF_PAGES_REF.search(catalog)
+    pages = pages_ref and _find_pdf_object(pdf_bytes, *pages_ref.groups())
+    page_count = pages and _PDF_PAGES_TYPE.search(pages) and _PDF_PAGE_COUNT.search(pages)
+    return int(page_count.group(1)) if page_count else None
+
+
+def _scan_pdf_source_page_count(pdf_source: Union[bytes, BinaryIO]) -> Optional[int]:
+    """Byte-scan PDF bytes or a PDF stream for its page count.
+
+    Streams up to PDF_SPOOL_MAX_SIZE are still in memory when spooled, so they are scanned from a copy;
+    larger ones have spilled to disk and are memory-mapped instead of being read into a full copy.
+    """
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return _scan_pdf_page_count(pdf_source)
+    if pdf_source.seek(0, io.SEEK_END) <= PDF_SPOOL_MAX_SIZE:
+        return _scan_pdf_page_count(_read_pdf_source(pdf_source))
+    try:
+        pdf_source.flush()
+        with mmap.mmap(pdf_source.fileno(), 0, access=mmap.ACCESS_READ) as pdf_map:
+            return _scan_pdf_page_count(pdf_map)
+    except (AttributeError, OSError, ValueError):
+        return None
 
 
-def get_pdf_page_count(pdf_content: bytes) -> int:
+def get_pdf_page_count(pdf_content: Union[bytes, BinaryIO]) -> int:
     """Extract total page count from PDF content."""
     try:
-        with pikepdf.Pdf.open(BytesIO(pdf_content)) as pdf:
+        page_count = _scan_pdf_source_page_count(pdf_content)
+        if page_count:
+            return page_count
+        # Fall back to a full parse for layouts the byte scan cannot follow.
+        with pikepdf.Pdf.open(_open_pdf_source(pdf_content)) as pdf:
             return len(pdf.pages)
     except Exception as e:  # noqa: B902 pylint: disable=broad-exception-caught
         current_app.logger.warning(f'Failed to get PDF page count: {e}')
@@ -42,36 +133,60 @@ def get_pdf_page_count(pdf_content: bytes) -> int:
 
 def add_page_numbers_to_pdf(
     template_vars: Dict[str, Any],
-    merged_pdf_without_footers: bytes,
-    generate_page_number: bool
+    merged_pdf_without_footers: Union[bytes, BinaryIO],
+    generate_page_number: bool,
+    total_pages: Optional[int] = None
 ) -> bytes:
-    """Add page numbers to PDF using footer generation logic."""
+    """Add page numbers to PDF using footer generation logic; total_pages skips the page count when known.
+
+    The main PDF may be given as bytes or as a seekable file, so large renders can stay spooled to disk.
+    """
     template_vars['generate_page_number'] = generate_page_number
-    total_pages = get_pdf_page_count(merged_pdf_without_footers)
+    if not total_pages:
+        total_pages = get_pdf_page_count(merged_pdf_without_footers)
 
     if total_pages > 500:
         return _add_footer_to_first_page_only(template_vars, merged_pdf_without_footers, total_pages)
 
+    if not generate_page_number:
+        return _add_repeated_footer(template_vars, merged_pdf_without_footers, total_pages)
+
+    concurrency = max(1, int(current_app.config.get('FOOTER_PDF_CONCURRENCY', 8)))
+    # Spread the pages over the workers, but keep at least FOOTER_MIN_BATCH_PAGES per Gotenberg render so
+    # small documents stay a single batch instead of costing one Chromium render per page.
+    batch_size = min(200, max(FOOTER_MIN_BATCH_PAGES, math.ceil(total_pages / concurrency)))
     batch_tasks = _prepare_footer_batch_tasks(
-        template_vars, total_pages, batch_size=200
+        template_vars, total_pages, batch_size=batch_size
     )
     footer_multi_page_pdfs = asyncio.run(
         GotenbergService.render_tasks_parallel_async(
-            batch_tasks, current_app.root_path
+            batch_tasks, current_app.root_path, max_concurrency=concurrency
         )
     )
-    footer_pdfs: List[bytes] = []
-    for pdf in footer_multi_page_pdfs:
-        footer_pdfs.extend(_split_pdf_pages(pdf))
-
     result = _overlay_footer_pdfs_on_main_pdf(
-        merged_pdf_without_footers, footer_pdfs
+        merged_pdf_without_footers, footer_multi_page_pdfs
     )
 
     return result
 
 
-def _add_footer_to_first_page_only(template_vars: Dict[str, Any], main_pdf_bytes: bytes, total_pages: int) -> bytes:
+def render_native_footer_html(template_vars: Dict[str, Any], generate_page_number: bool) -> str:
+    """Render the footer as a Chromium footer.html; Chromium fills in the pageNumber/totalPages spans."""
+    footer_args = dict(template_vars)
+    footer_args['generate_page_number'] = generate_page_number
+    footer_args.pop('current_page', None)
+    footer_args.pop('total_pages', None)
+    footer_template = ENV.get_template(f'{TEMPLATE_FOLDER_PATH}/generic_footer.html')
+    native_style = ENV.get_template(f'{TEMPLATE_FOLDER_PATH}/styles/footer_native.html').render()
+    return (
+        f'<!DOCTYPE html><html><head>{native_style}</head>'
+        f'<body>{footer_template.render(footer_args)}</body></html>'
+    )
+
+
+def _add_footer_to_first_page_only(
+    template_vars: Dict[str, Any], main_pdf_bytes: Union[bytes, BinaryIO], total_pages: int
+) -> bytes:
     """Add footer only to the first page for large documents."""
     batch_tasks = _prepare_footer_batch_tasks(template_vars, total_pages, batch_size=1, first_page_only=True)
 
@@ -82,13 +197,27 @@ def _add_footer_to_first_page_only(template_vars: Dict[str, Any], main_pdf_bytes
     )
 
     if not footer_multi_page_pdfs:
-        return main_pdf_bytes
+        return _read_pdf_source(main_pdf_bytes)
 
-    first_page_footer = _split_pdf_pages(footer_multi_page_pdfs[0])[0]
+    return _overlay_footer_pdfs_on_main_pdf(main_pdf_bytes, footer_multi_page_pdfs[:1])
 
-    footer_pdfs = [first_page_footer]
 
-    return _overlay_footer_pdfs_on_main_pdf(main_pdf_bytes, footer_pdfs)
+def _add_repeated_footer(
+    template_vars: Dict[str, Any], main_pdf_bytes: Union[bytes, BinaryIO], total_pages: int
+) -> bytes:
+    """Add the same footer to every page; without page numbers one rendered footer page serves them all."""
+    batch_tasks = _prepare_footer_batch_tasks(template_vars, total_pages, batch_size=1, first_page_only=True)
+
+    footer_multi_page_pdfs = asyncio.run(
+        GotenbergService.render_tasks_parallel_async(
+            batch_tasks, current_app.root_path
+        )
+    )
+
+    if not footer_multi_page_pdfs:
+        return _read_pdf_source(main_pdf_bytes)
+
+    return _overlay_footer_pdfs_on_main_pdf(main_pdf_bytes, footer_multi_page_pdfs[:1], repeat_footer=True)
 
 
 def _prepare_footer_batch_tasks(
@@ -98,10 +227,10 @@ def _prepare_footer_batch_tasks(
     first_page_only: bool = False
 ) -> List[Tuple[int, str]]:
     """Prepare footer batch tasks."""
-    footer_template = _TEMPLATE_ENV.get_template(
+    footer_template = ENV.get_template(
         f'{TEMPLATE_FOLDER_PATH}/generic_footer.html'
     )
-    overlay_style = _TEMPLATE_ENV.get_template(
+    overlay_style = ENV.get_template(
         f'{TEMPLATE_FOLDER_PATH}/styles/footer_overlay.html'
     ).render()
 
@@ -135,54 +264,59 @@ def _prepare_footer_batch_tasks(
     return tasks
 
 
-def _split_pdf_pages(pdf_bytes: bytes) -> List[bytes]:
-    """Split a multi-page PDF into individual page PDFs."""
-    individual_pdfs = []
-
-    try:
-        with pikepdf.Pdf.open(io.BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                single_page_pdf = pikepdf.Pdf.new()
-                single_page_pdf.pages.append(page)
-
-                output_buffer = io.BytesIO()
-                single_page_pdf.save(output_buffer)
-                individual_pdfs.append(output_buffer.getvalue())
-
-    except Exception as e:  # noqa: B902
-        current_app.logger.error(f'Error splitting PDF pages: {e}')
-        raise
-
-    return individual_pdfs
-
-
 def _overlay_footer_pdfs_on_main_pdf(
-    main_pdf_bytes: bytes, footer_pdfs: list
+    main_pdf_bytes: Union[bytes, BinaryIO], footer_pdfs: List[bytes], repeat_footer: bool = False
 ) -> bytes:
-    """Overlay footer PDFs onto each page of the main PDF."""
+    """Overlay footer pages onto each page of the main PDF.
+
+    footer_pdfs are the rendered footer batches; their pages, taken in order, line up with the main pages.
+    With repeat_footer the first footer page goes on every page as a single shared Form XObject.
+    """
     try:
-        with pikepdf.Pdf.open(io.BytesIO(main_pdf_bytes)) as main_pdf:
+        with pikepdf.Pdf.open(_open_pdf_source(main_pdf_bytes)) as main_pdf, contextlib.ExitStack() as stack:
+            footer_pages = _open_footer_pages(stack, footer_pdfs)
             result_pdf = pikepdf.Pdf.new()
+            shared_footer_xobject = None
 
             for i, main_page in enumerate(main_pdf.pages):
                 result_pdf.pages.append(main_page)
-                new_page = result_pdf.pages[-1]  # Get the newly added page
 
-                has_footer_pdf = i < len(footer_pdfs)
-                if has_footer_pdf:
-                    with pikepdf.Pdf.open(io.BytesIO(footer_pdfs[i])) as footer_pdf:
-                        if len(footer_pdf.pages) > 0:
-                            footer_page = footer_pdf.pages[0]
-                            page_width, band_height = _prepare_footer_page_for_overlay(footer_page, new_page)
-                            _overlay_page_content(new_page, footer_page, page_width=page_width, band_height=band_height)
+                footer_index = 0 if repeat_footer else i
+                if footer_index < len(footer_pages):
+                    shared_footer_xobject = _stamp_footer(
+                        result_pdf, result_pdf.pages[-1], footer_pages[footer_index],
+                        repeat_footer, shared_footer_xobject
+                    )
 
             output_buffer = io.BytesIO()
-            result_pdf.save(output_buffer)
+            result_pdf.save(output_buffer, **PDF_SAVE_OPTIONS)
             return output_buffer.getvalue()
 
     except Exception as e:  # noqa: B902 pylint: disable=broad-exception-caught
         current_app.logger.error(f'Error overlaying footer PDFs: {e}')
-        return main_pdf_bytes
+        return _read_pdf_source(main_pdf_bytes)
+
+
+def _open_footer_pages(stack: contextlib.ExitStack, footer_pdfs: List[bytes]) -> list:
+    """Open each footer batch once (closed with the stack) and return all their pages in order."""
+    footer_docs = [stack.enter_context(pikepdf.Pdf.open(io.BytesIO(pdf))) for pdf in footer_pdfs]
+    return [page for footer_doc in footer_docs for page in footer_doc.pages]
+
+
+def _stamp_footer(result_pdf: pikepdf.Pdf, page, footer_page, repeat_footer: bool, shared_xobject=None):
+    """Overlay footer_page onto page (already in result_pdf) and return the shared footer Form XObject, if any.
+
+    With repeat_footer the footer is embedded once as a Form XObject and referenced from every page,
+    instead of a copy per page; pass the returned XObject back in for the following pages.
+    """
+    page_width, band_height = _prepare_footer_page_for_overlay(footer_page, page)
+    overlay = footer_page
+    if repeat_footer:
+        if shared_xobject is None:
+            shared_xobject = result_pdf.copy_foreign(footer_page.as_form_xobject())
+        overlay = shared_xobject
+    _overlay_page_content(page, overlay, page_width=page_width, band_height=band_height)
+    return shared_xobject
 
 
 def _prepare_footer_page_for_overlay(footer_page, base_page) -> tuple:
@@ -197,7 +331,7 @@ def _prepare_footer_page_for_overlay(footer_page, base_page) -> tuple:
 
 
 def _overlay_page_content(base_page, overlay_page, page_width: float, band_height: float):
-    """Overlay content from overlay_page onto base_page using pikepdf."""
+    """Overlay overlay_page (a footer page or an already embedded Form XObject) onto base_page using pikepdf."""
     try:
         if hasattr(base_page, 'add_overlay'):
             rect = pikepdf.Rectangle(0, 0, page_width, band_height)
@@ -1,11 +1,19 @@
 """Service for Gotenberg PDF generation operations."""
 import asyncio
+import contextlib
 import gc
-from typing import List, Tuple
+import shutil
+from typing import BinaryIO, List, Optional, Tuple
 
 import aiohttp
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
+
+# Shared across requests so sync Gotenberg calls reuse keep-alive connections instead of reconnecting each time.
+_GOTENBERG_SESSION = requests.Session()
+_GOTENBERG_SESSION.mount('http://', HTTPAdapter(pool_maxsize=16))
+_GOTENBERG_SESSION.mount('https://', HTTPAdapter(pool_maxsize=16))
 
 
 class GotenbergService:
@@ -50,17 +58,23 @@ class GotenbergService:
     async def render_tasks_parallel_async(
         tasks: List[Tuple[int, str]],
         base_url: str,
+        max_concurrency: Optional[int] = None,
     ) -> List[bytes]:
         """Render HTML tasks in parallel using shared session for better performance."""
         results: List[Tuple[int, bytes]] = []
+        limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
+
+        async def _render(html_out: str, session: aiohttp.ClientSession) -> bytes:
+            async with limiter:
+                return await GotenbergService._render_pdf_bytes_worker_gotenberg_with_session(
+                    (html_out, base_url), session
+                )
 
         async with aiohttp.ClientSession() as session:
             async_tasks = []
             order_ids = []
             for oid, html_out in tasks:
-                task = GotenbergService._render_pdf_bytes_worker_gotenberg_with_session(
-                    (html_out, base_url), session
-                )
+                task = _render(html_out, session)
                 async_tasks.append(task)
                 order_ids.append(oid)
 
@@ -72,15 +86,29 @@ class GotenbergService:
         return [pdf for _, pdf in sorted(results, key=lambda x: x[0])]
 
     @staticmethod
-    def convert_html_to_pdf_sync(html_content: str, timeout: int = 500) -> requests.Response:
-        """Convert HTML content to PDF using Gotenberg synchronously."""
+    def _build_convert_request(html_content: str, footer_html: Optional[str] = None) -> Tuple[str, list, dict]:
+        """Build the endpoint and multipart payload for a Chromium HTML conversion."""
         gotenberg_url = GotenbergService._get_gotenberg_url()
         endpoint = f'{gotenberg_url}/forms/chromium/convert/html'
 
         files = [('files', ('index.html', html_content, 'text/html'))]
         data = {}
+        if footer_html:
+            files.append(('files', ('footer.html', footer_html, 'text/html')))
+            # Leave room for the footer band (logo + page number), in inches.
+            data['marginBottom'] = current_app.config.get('GOTENBERG_FOOTER_MARGIN', '1.25')
+        return endpoint, files, data
 
-        resp = requests.post(
+    @staticmethod
+    def convert_html_to_pdf_sync(
+        html_content: str,
+        timeout: int = 500,
+        footer_html: Optional[str] = None
+    ) -> requests.Response:
+        """Convert HTML content to PDF using Gotenberg synchronously, optionally with a native Chromium footer."""
+        endpoint, files, data = GotenbergService._build_convert_request(html_content, footer_html)
+
+        resp = _GOTENBERG_SESSION.post(
             endpoint,
             files=files,
             data=data,
@@ -88,3 +116,20 @@ class GotenbergService:
         )
         resp.raise_for_status()
         return resp
+
+    @staticmethod
+    def convert_html_to_pdf_stream(html_content: str, output_stream: BinaryIO, timeout: int = 500) -> None:
+        """Convert HTML content to PDF using Gotenberg, copying the response body into output_stream."""
+        endpoint, files, data = GotenbergService._build_convert_request(html_content)
+
+        with _GOTENBERG_SESSION.post(
+            endpoint,
+            files=files,
+            data=data,
+            timeout=timeout,
+            stream=True
+        ) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, output_stream)
+        output_stream.seek(0)
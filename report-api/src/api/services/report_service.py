@@ -15,44 +15,63 @@
 """Service to  manage report-templates."""
 
 import base64
+import functools
+import tempfile
+from datetime import datetime
 
 from dateutil import parser
-from flask import url_for
-from jinja2 import Environment, FileSystemLoader
+from flask import current_app
 from jinja2.sandbox import SandboxedEnvironment
 from weasyprint import HTML
 
 from api.services.chunk_report_service import ChunkReportService
-from api.services.footer_service import add_page_numbers_to_pdf
+from api.services.footer_service import PDF_SPOOL_MAX_SIZE, add_page_numbers_to_pdf, render_native_footer_html
 from api.services.gotenberg_service import GotenbergService
 from api.services.page_info import populate_page_count, populate_page_info
+from api.services.template_env import ENV
 from api.utils.util import TEMPLATE_FOLDER_PATH, sanitize_template_name
 
 
+_DATETIME_FORMATS = {
+    'full': '%m-%d-%Y %I:%M %p',
+    'short': '%m-%d-%Y',
+    'month': '%B',
+    'yyyy-mm-dd': '%Y-%m-%d',
+    'mmm dd,yyyy': '%B %e, %Y',
+    'detail': '%B %d, %Y at %I:%M %p Pacific Time',
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    """Parse a datetime string, memoized since statement rows repeat the same timestamps."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parser.parse(value)
+
+
 def format_datetime(value, format='short'):  # pylint: disable=redefined-builtin
     """Filter to format datetime globally."""
-    dt_format = '%m-%d-%Y'
-    if format == 'full':
-        dt_format = '%m-%d-%Y %I:%M %p'
-    elif format == 'short':
-        dt_format = '%m-%d-%Y'
-    elif format == 'month':
-        dt_format = '%B'
-    elif format == 'yyyy-mm-dd':
-        dt_format = '%Y-%m-%d'
-    elif format == 'mmm dd,yyyy':
-        dt_format = '%B %e, %Y'
-    elif format == 'detail':
-        dt_format = '%B %d, %Y at %I:%M %p Pacific Time'
-    elif format == 'unix':
-        return int(parser.parse(value).timestamp())
-
-    return parser.parse(value).strftime(dt_format)
-
-
-ENV = Environment(loader=FileSystemLoader('.'), autoescape=True)
+    parsed = _parse_datetime(value)
+    if format == 'unix':
+        return int(parsed.timestamp())
+
+    return parsed.strftime(_DATETIME_FORMATS.get(format, '%m-%d-%Y'))
+
+
 ENV.filters['format_datetime'] = format_datetime
 
+# User-supplied templates are compiled per request, but the sandbox itself is stateless and reusable.
+SANDBOX_ENV = SandboxedEnvironment(autoescape=True)
+SANDBOX_ENV.filters['format_datetime'] = format_datetime
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_user_template(source: bytes):
+    """Decode and compile a user-supplied template once per distinct source; callers often resend the same one."""
+    return SANDBOX_ENV.from_string(source.decode('utf-8'))
+
 
 class ReportService:
     """Service for all template related operations."""
@@ -84,11 +103,18 @@ class ReportService:
         template_args: dict = None
     ):
         """Generate pdf out of the html using Gotenberg."""
-        main_pdf_bytes = GotenbergService.convert_html_to_pdf_sync(html_out).content
-
         footer_args = dict(template_args or {})
         footer_args['current_template'] = template_name
-        return add_page_numbers_to_pdf(footer_args, main_pdf_bytes, generate_page_number)
+
+        if current_app.config.get('GOTENBERG_NATIVE_FOOTER'):
+            # Single pass: Chromium stamps the footer and page numbers, no page count or overlay needed.
+            footer_html = render_native_footer_html(footer_args, generate_page_number)
+            return GotenbergService.convert_html_to_pdf_sync(html_out, footer_html=footer_html).content
+
+        # Stream the render into a spooled file rather than holding response.content plus a BytesIO copy.
+        with tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE) as main_pdf:
+            GotenbergService.convert_html_to_pdf_stream(html_out, main_pdf)
+            return add_page_numbers_to_pdf(footer_args, main_pdf, generate_page_number)
 
     @classmethod
     def create_report_from_stored_template(
@@ -100,8 +126,8 @@ class ReportService:
         """Create a report from a stored template."""
         sanitized_name = sanitize_template_name(template_name)
         template = ENV.get_template(f'{TEMPLATE_FOLDER_PATH}/{sanitized_name}.html')
-        bc_logo_url = url_for('static', filename='images/bcgov-logo-vert.jpg')
-        registries_url = url_for('static', filename='images/reg_logo.png')
+        bc_logo_url = current_app.config['BC_LOGO_URL']
+        registries_url = current_app.config['REGISTRIES_LOGO_URL']
         html_out = template.render(
             template_args, bclogoUrl=bc_logo_url, registriesurl=registries_url
         )
@@ -118,11 +144,16 @@ class ReportService:
     def create_report_from_template(cls, template_string: str, template_args: object,
                                     generate_page_number: bool = False):
         """Create a report from a json template."""
-        template_decoded = base64.b64decode(template_string).decode('utf-8')
+        return cls.create_report_from_template_bytes(
+            base64.b64decode(template_string), template_args, generate_page_number
+        )
+
+    @classmethod
+    def create_report_from_template_bytes(cls, template_bytes: bytes, template_args: object,
+                                          generate_page_number: bool = False):
+        """Create a report from a raw (not base64 encoded) UTF-8 template."""
         # Use a sandboxed environment for user-supplied templates
-        sandbox_env = SandboxedEnvironment(autoescape=True)
-        sandbox_env.filters['format_datetime'] = format_datetime
-        template_ = sandbox_env.from_string(template_decoded)
+        template_ = _compile_user_template(bytes(template_bytes))
         html_out = template_.render(template_args)
 
         return ReportService.generate_pdf_weasyprint(html_out, generate_page_number)
@@ -0,0 +1,29 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared Jinja environment for the stored report-templates.
+
+Templates include each other by repo-relative path (e.g. 'report-templates/styles/footer.html'),
+so the loader stays rooted at the working directory.
+"""
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# Stored templates only change on deploy, so skip the per-render mtime check (auto_reload) and
+# persist compiled bytecode so a fresh worker does not have to re-parse every template.
+ENV = Environment(
+    loader=FileSystemLoader('.'),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
@@ -14,6 +14,8 @@
 
 """Common setup and fixtures for the py-test suite used by this service."""
 
+import io
+
 import pytest
 import requests as _req
 
@@ -100,6 +102,16 @@ startxref
         status_code = 200
         content = mock_pdf_content
 
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        @property
+        def raw(self):
+            return io.BytesIO(mock_pdf_content)
+
         def raise_for_status(self):
             pass
 
@@ -127,6 +139,7 @@ startxref
             return MockAsyncResponse()
 
     monkeypatch.setattr(_req, 'post', lambda *args, **kwargs: MockResponse())
+    monkeypatch.setattr(_req.Session, 'post', lambda self, *args, **kwargs: MockResponse())
     monkeypatch.setattr('aiohttp.ClientSession', MockAsyncSession)
 
     return MockResponse()
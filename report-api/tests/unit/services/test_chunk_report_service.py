@@ -59,7 +59,7 @@ class _DummyPdf:
     def __exit__(self, exc_type, exc, tb):
         return False
 
-    def save(self, buf):
+    def save(self, buf, **_kwargs):
         # Write bytes proportional to number of pages so len > 0
         buf.write(b'X' * (len(self.pages) + 1))
 
@@ -89,3 +89,23 @@ def test_merge_pdf_files_merges_two_pdfs(tmp_path, monkeypatch):
     merged = ChunkReportService._merge_pdf_files([str(p1), str(p2)])
     assert isinstance(merged, (bytes, bytearray))
     assert len(merged) > 0
+
+
+def test_merge_pdf_files_with_page_count(tmp_path, monkeypatch):
+    """Merging should report the merged page count so the footer pass can skip re-counting."""
+    paths = []
+    for name in ('a.pdf', 'b.pdf', 'c.pdf'):
+        path = tmp_path / name
+        path.write_bytes(b'X')
+        paths.append(str(path))
+
+    fake_module = types.SimpleNamespace()
+    fake_module.open = staticmethod(lambda _path: _DummyPdf(pages=[b'pg']))
+    fake_module.new = staticmethod(lambda: _DummyPdf())
+
+    import pikepdf as _pike
+    monkeypatch.setattr(_pike, 'Pdf', fake_module)
+
+    merged, page_count = ChunkReportService._merge_pdf_files_with_page_count(paths)
+    assert len(merged) > 0
+    assert page_count == 3
@@ -0,0 +1,152 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test footer service."""
+
+import io
+import tempfile
+
+import pikepdf
+import pytest
+
+from api.services import footer_service
+
+
+def _make_pdf(page_count: int) -> bytes:
+    pdf = pikepdf.Pdf.new()
+    for _ in range(page_count):
+        pdf.add_blank_page(page_size=(612, 792))
+    buf = io.BytesIO()
+    pdf.save(buf)
+    return buf.getvalue()
+
+
+def _footer_xobjects(pdf_bytes: bytes):
+    with pikepdf.Pdf.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [[xobj.objgen for xobj in page.Resources.XObject.values()] for page in pdf.pages]
+
+
+def test_overlay_walks_pages_across_footer_batches(app):
+    """Footer pages from several batch PDFs should line up with the main pages in order."""
+    with app.app_context():
+        result = footer_service._overlay_footer_pdfs_on_main_pdf(_make_pdf(3), [_make_pdf(2), _make_pdf(1)])
+
+    xobjects = _footer_xobjects(result)
+    assert len(xobjects) == 3
+    assert all(len(page_xobjects) == 1 for page_xobjects in xobjects)
+    assert len({page_xobjects[0] for page_xobjects in xobjects}) == 3
+
+
+def test_overlay_repeat_footer_shares_one_xobject(app):
+    """A repeated footer should be embedded once and referenced from every page."""
+    with app.app_context():
+        result = footer_service._overlay_footer_pdfs_on_main_pdf(_make_pdf(4), [_make_pdf(1)], repeat_footer=True)
+
+    xobjects = _footer_xobjects(result)
+    assert len(xobjects) == 4
+    assert len({page_xobjects[0] for page_xobjects in xobjects}) == 1
+
+
+def test_scan_pdf_page_count_reads_page_tree():
+    """The byte scan should read the page count of a plain PDF without pikepdf."""
+    assert footer_service._scan_pdf_page_count(_make_pdf(7)) == 7
+
+
+def test_scan_pdf_page_count_ignores_indirect_count():
+    """An indirect /Count must not be read as the page count; the scan should give up instead."""
+    pdf_bytes = _make_pdf(3).replace(b'/Count 3', b'/Count 12 0 R')
+
+    assert footer_service._scan_pdf_page_count(pdf_bytes) is None
+
+
+def test_get_pdf_page_count_scans_spooled_file(app, monkeypatch):
+    """Spooled PDFs should be byte-scanned whether still in memory or spilled to disk, without pikepdf."""
+    def fail_open(*_args, **_kwargs):
+        raise AssertionError('pikepdf should not be needed')
+
+    monkeypatch.setattr(footer_service.pikepdf.Pdf, 'open', fail_open)
+    with app.app_context():
+        for spool_size, scan_limit in ((10 * 1024 * 1024, 10 * 1024 * 1024), (1, 100)):
+            monkeypatch.setattr(footer_service, 'PDF_SPOOL_MAX_SIZE', scan_limit)
+            with tempfile.SpooledTemporaryFile(max_size=spool_size) as spooled:
+                spooled.write(_make_pdf(5))
+
+                assert footer_service.get_pdf_page_count(spooled) == 5
+
+
+def test_get_pdf_page_count_falls_back_for_object_streams(app):
+    """Catalogs hidden in compressed object streams should still be counted through pikepdf."""
+    pdf = pikepdf.Pdf.new()
+    for _ in range(3):
+        pdf.add_blank_page(page_size=(612, 792))
+    buf = io.BytesIO()
+    pdf.save(buf, object_stream_mode=pikepdf.ObjectStreamMode.generate)
+
+    assert footer_service._scan_pdf_page_count(buf.getvalue()) is None
+    with app.app_context():
+        assert footer_service.get_pdf_page_count(buf) == 3
+
+
+def _capture_footer_batches(monkeypatch):
+    captured = {}
+
+    async def fake_render(tasks, base_url, max_concurrency=None):
+        captured['tasks'] = tasks
+        captured['max_concurrency'] = max_concurrency
+        return []
+
+    monkeypatch.setattr(footer_service.GotenbergService, 'render_tasks_parallel_async', staticmethod(fake_render))
+    monkeypatch.setattr(footer_service, '_overlay_footer_pdfs_on_main_pdf', lambda main, footers: main)
+    return captured
+
+
+@pytest.mark.parametrize('total_pages,expected_batch_sizes', [
+    (2, [2]),
+    (16, [16]),
+    (50, [50]),
+    (120, [50, 50, 20]),
+    (400, [100, 100, 100, 100]),
+    (500, [125, 125, 125, 125]),
+])
+def test_add_page_numbers_spreads_pages_over_concurrency(app, monkeypatch, total_pages, expected_batch_sizes):
+    """Large documents are split over FOOTER_PDF_CONCURRENCY workers; small ones stay a single batch."""
+    captured = _capture_footer_batches(monkeypatch)
+    monkeypatch.setitem(app.config, 'FOOTER_PDF_CONCURRENCY', 4)
+
+    with app.app_context():
+        footer_service.add_page_numbers_to_pdf({}, b'%PDF', True, total_pages=total_pages)
+
+    batch_sizes = [html.count('class="footer-page"') for _, html in captured['tasks']]
+    assert batch_sizes == expected_batch_sizes
+    assert captured['max_concurrency'] == 4
+
+
+def test_add_page_numbers_without_pages(app, monkeypatch):
+    """A document without pages should come back unchanged instead of failing on a zero batch size."""
+    captured = _capture_footer_batches(monkeypatch)
+    monkeypatch.setattr(footer_service, 'get_pdf_page_count', lambda _pdf: 0)
+
+    with app.app_context():
+        assert footer_service.add_page_numbers_to_pdf({}, b'%PDF', True) == b'%PDF'
+
+    assert captured['tasks'] == []
+
+
+def test_render_native_footer_html_leaves_page_numbers_to_chromium(app):
+    """The native footer should carry Chromium's pageNumber/totalPages spans, not a rendered page number."""
+    with app.app_context():
+        footer_html = footer_service.render_native_footer_html({'current_page': 1, 'total_pages': 2}, True)
+
+    assert '<span class="pageNumber"></span>' in footer_html
+    assert '<span class="totalPages"></span>' in footer_html
+    assert 'Page 1 of 2' not in footer_html
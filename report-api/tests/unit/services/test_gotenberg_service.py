@@ -0,0 +1,40 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test gotenberg service."""
+
+import asyncio
+
+from api.services.gotenberg_service import GotenbergService
+
+
+def test_render_tasks_parallel_async_limits_concurrency(monkeypatch):
+    """No more than max_concurrency renders should be in flight, and results keep the task order."""
+    in_flight = {'now': 0, 'max': 0}
+
+    async def fake_worker(args, _session):
+        in_flight['now'] += 1
+        in_flight['max'] = max(in_flight['max'], in_flight['now'])
+        await asyncio.sleep(0.01)
+        in_flight['now'] -= 1
+        return args[0].encode()
+
+    monkeypatch.setattr(
+        GotenbergService, '_render_pdf_bytes_worker_gotenberg_with_session', staticmethod(fake_worker)
+    )
+    tasks = [(i, f'batch-{i}') for i in range(6)]
+
+    results = asyncio.run(GotenbergService.render_tasks_parallel_async(tasks, '/', max_concurrency=2))
+
+    assert results == [f'batch-{i}'.encode() for i in range(6)]
+    assert in_flight['max'] == 2
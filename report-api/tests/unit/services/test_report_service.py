@@ -0,0 +1,80 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test report service."""
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+from api.services import gotenberg_service
+from api.services.report_service import ReportService, _compile_user_template, format_datetime
+
+
+@pytest.mark.parametrize('value,dt_format,expected', [
+    ('2024-03-05T14:30:00', 'short', '03-05-2024'),
+    ('2024-03-05T14:30:00', 'full', '03-05-2024 02:30 PM'),
+    ('2024-03-05T14:30:00', 'month', 'March'),
+    ('2024-03-05T14:30:00', 'yyyy-mm-dd', '2024-03-05'),
+    ('2024-03-05T14:30:00', 'detail', 'March 05, 2024 at 02:30 PM Pacific Time'),
+    ('2024-03-05T14:30:00', 'unknown', '03-05-2024'),
+    ('2024-03-05T14:30:00+00:00', 'unix', 1709649000),
+    ('March 5, 2024 2:30 PM', 'short', '03-05-2024'),
+])
+def test_format_datetime(value, dt_format, expected):
+    """Formats ISO and free-form dates the same way the dateutil-only filter did."""
+    assert format_datetime(value, dt_format) == expected
+
+
+def test_compile_user_template_reuses_compiled_template():
+    """The same template source should compile once and still render with the sandbox filters."""
+    source = b'{{ created | format_datetime("yyyy-mm-dd") }} {{ name }}'
+
+    template = _compile_user_template(source)
+
+    assert _compile_user_template(bytes(bytearray(source))) is template
+    assert template.render(created='2024-03-05T14:30:00', name='<b>') == '2024-03-05 &lt;b&gt;'
+
+
+def test_create_report_from_template_decodes_base64_once(monkeypatch):
+    """Base64 and raw template inputs should render the same html."""
+    monkeypatch.setattr(ReportService, 'generate_pdf_weasyprint', staticmethod(lambda html, _page_number: html))
+    raw = '<p>{{ name }}</p>'.encode('utf-8')
+
+    from_base64 = ReportService.create_report_from_template(base64.b64encode(raw).decode('utf-8'), {'name': 'a'})
+    from_bytes = ReportService.create_report_from_template_bytes(memoryview(raw), {'name': 'a'})
+
+    assert from_base64 == from_bytes == '<p>a</p>'
+
+
+def test_generate_pdf_native_footer_sends_footer_part(app, monkeypatch):
+    """With GOTENBERG_NATIVE_FOOTER on, the footer and bottom margin go to Gotenberg in the same request."""
+    captured = {}
+
+    def fake_post(endpoint, files, data, timeout):
+        captured.update(endpoint=endpoint, files=files, data=data)
+        return SimpleNamespace(content=b'%PDF-native', raise_for_status=lambda: None)
+
+    monkeypatch.setattr(gotenberg_service._GOTENBERG_SESSION, 'post', fake_post)
+    monkeypatch.setitem(app.config, 'GOTENBERG_NATIVE_FOOTER', True)
+    monkeypatch.setitem(app.config, 'GOTENBERG_FOOTER_MARGIN', '1.5')
+
+    with app.app_context():
+        result = ReportService.generate_pdf('statement_report', '<p>body</p>', generate_page_number=True)
+
+    parts = {name: content for _, (name, content, _mimetype) in captured['files']}
+    assert result == b'%PDF-native'
+    assert parts['index.html'] == '<p>body</p>'
+    assert 'class="pageNumber"' in parts['footer.html']
+    assert captured['data'] == {'marginBottom': '1.5'}